@@ -5,30 +5,87 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import pytz
 from django import forms
-from django.utils.safestring import mark_safe
+from django.utils.functional import lazy
 from django.utils.translation import gettext_lazy as _, gettext
 
-from djblets.conditions.conditions import ConditionSet
+from djblets.conditions.conditions import Condition, ConditionSet
 from djblets.conditions.errors import (ConditionChoiceNotFoundError,
                                        ConditionOperatorNotFoundError,
                                        InvalidConditionModeError,
                                        InvalidConditionValueError)
 from djblets.forms.widgets import ConditionsWidget, ListEditWidget
+from djblets.util.html import mark_safe_lazy
 
 if TYPE_CHECKING:
     from djblets.conditions.choices import ConditionChoices
     from djblets.util.typing import KwargsDict
 
 
-TIMEZONE_CHOICES = tuple(zip(pytz.common_timezones, pytz.common_timezones))
+_timezone_choices = None
+
+
+def _get_timezone_choices():
+    """Return the choices for common timezones.
+
+    The choices are built the first time this is called, and then shared
+    across all callers.
+
+    Version Added:
+        6.0
+
+    Returns:
+        tuple:
+        A tuple of ``(timezone, timezone)`` choice pairs.
+    """
+    global _timezone_choices
+
+    if _timezone_choices is None:
+        # pytz is imported here, so that it's only loaded if timezone choices
+        # are actually needed.
+        import pytz
+
+        _timezone_choices = tuple([
+            (timezone, timezone)
+            for timezone in pytz.common_timezones
+        ])
+
+    return _timezone_choices
+
+
+#: The choices for all common timezones.
+#:
+#: Version Changed:
+#:     6.0:
+#:     This is now computed lazily, the first time it's accessed.
+TIMEZONE_CHOICES = lazy(_get_timezone_choices, tuple)()
 
 
 class TimeZoneField(forms.ChoiceField):
     """A form field that only allows pytz common timezones as the choices."""
 
-    def __init__(self, choices=TIMEZONE_CHOICES, *args, **kwargs):
+    def __init__(self, choices=None, *args, **kwargs):
+        """Initialize the field.
+
+        Version Changed:
+            6.0:
+            ``choices`` now defaults to ``None``, which will use the shared
+            list of common timezones.
+
+        Args:
+            choices (list of tuple, optional):
+                The choices for the field. If not provided, this will default
+                to all common timezones.
+
+            *args (tuple):
+                Extra positional arguments for the field.
+
+            **kwargs (dict):
+                Extra keyword arguments for the field.
+        """
+        if choices is None:
+            choices = _get_timezone_choices()
+
         super(TimeZoneField, self).__init__(choices=choices, *args, **kwargs)
 
 
@@ -52,15 +109,18 @@ class ConditionsField(forms.Field):
         'value_required': _('A value is required for this condition.'),
     }
 
-    ######################
-    # Instance variables #
-    ######################
-
-    #: The condition choies for the field.
+    #: The choices for the mode field.
     #:
-    #: Type:
-    #:     djblets.conditions.choices.ConditionChoices
-    choices: ConditionChoices
+    #: These are shared across all instances of the field, and are
+    #: translated when rendered.
+    _MODE_CHOICES = (
+        (ConditionSet.MODE_ALWAYS,
+         mark_safe_lazy(_('Always match'))),
+        (ConditionSet.MODE_ALL,
+         mark_safe_lazy(_('Match <b>all</b> of the following:'))),
+        (ConditionSet.MODE_ANY,
+         mark_safe_lazy(_('Match <b>any</b> of the following:'))),
+    )
 
     def __init__(self, choices, choice_kwargs=None, *args, **kwargs):
         """Initialize the field.
@@ -98,28 +158,16 @@ class ConditionsField(forms.Field):
                     _('%s must define a non-empty "operators" attribute.')
                     % choice.__name__)
 
-        widget_cls = kwargs.get('widget', self.widget)
-
-        self.choices = choices
+        widget_cls = kwargs.pop('widget', self.widget)
 
         self.mode_field = forms.ChoiceField(
             required=True,
-            choices=(
-                (ConditionSet.MODE_ALWAYS,
-                 mark_safe(_('Always match'))),
-                (ConditionSet.MODE_ALL,
-                 mark_safe(_('Match <b>all</b> of the following:'))),
-                (ConditionSet.MODE_ANY,
-                 mark_safe(_('Match <b>any</b> of the following:')))
-            ),
+            choices=self._MODE_CHOICES,
             widget=forms.widgets.RadioSelect())
 
         self.choice_field = forms.ChoiceField(
             required=True,
-            choices=(
-                (choice.choice_id, choice.name)
-                for choice in choices
-            ))
+            choices=self._build_choice_field_choices(choices))
 
         self.operator_field = forms.ChoiceField(required=True)
 
@@ -131,6 +179,41 @@ class ConditionsField(forms.Field):
                               choice_kwargs=choice_kwargs or {}),
             *args, **kwargs)
 
+    @property
+    def choices(self) -> ConditionChoices:
+        """The condition choices for the field.
+
+        Setting this will update the list of choices shown for each condition.
+        This can be set to a class or a function that returns an instance, in
+        which case it will be constructed or called once and the resulting
+        instance stored.
+
+        Version Changed:
+            6.0:
+            This is now backed by the widget's choices, and can be safely
+            changed after the field is constructed.
+
+        Type:
+            djblets.conditions.choices.ConditionChoices
+        """
+        return self.widget.choices
+
+    @choices.setter
+    def choices(self, value):
+        """The condition choices for the field.
+
+        Args:
+            value (djblets.conditions.choices.ConditionChoices or callable):
+                The new condition choices to set.
+        """
+        if callable(value):
+            value = value()
+
+        widget = self.widget
+        widget.choices = value
+        widget.choice_widget.choices = \
+            self._build_choice_field_choices(value)
+
     @property
     def choice_kwargs(self) -> KwargsDict:
         """The keyword arguments passed to ConditionChoice functions.
@@ -177,20 +260,20 @@ class ConditionsField(forms.Field):
             ValueError:
                 The value provided is not valid for the widget.
         """
-        if isinstance(data, ConditionSet):
-            data = data.serialize()
+        if isinstance(data, dict):
+            # This is the common case when re-rendering a bound form.
+            return data
+        elif isinstance(data, ConditionSet):
+            return data.serialize()
         elif data is None:
-            data = {
+            return {
                 'mode': ConditionSet.DEFAULT_MODE,
                 'conditions': [],
             }
 
-        if not isinstance(data, dict):
-            raise ValueError(
-                gettext('%r is not a valid value for a %s')
-                % (data, self.__class__.__name__))
-
-        return data
+        raise ValueError(
+            gettext('%r is not a valid value for a %s')
+            % (data, self.__class__.__name__))
 
     def to_python(self, value):
         """Parse and return conditions from the field's data.
@@ -198,6 +281,12 @@ class ConditionsField(forms.Field):
         This takes the serialized values provided by the field's widget,
         ensures they're valid, and returns a list of the resulting conditions.
 
+        Version Changed:
+            6.0:
+            All conditions are now validated before raising an error, and
+            every invalid condition will be recorded in the widget's
+            ``condition_errors``.
+
         Args:
             value (dict):
                 The raw form data, as provided by the widget.
@@ -205,6 +294,10 @@ class ConditionsField(forms.Field):
         Returns:
             djblets.conditions.conditions.ConditionSet:
             The resulting condition set from the form.
+
+        Raises:
+            django.forms.ValidationError:
+                The mode or one or more conditions were invalid.
         """
         if not value:
             # Let validate() handle this. It will be run by clean() after this
@@ -212,28 +305,63 @@ class ConditionsField(forms.Field):
             return None
 
         try:
-            condition_set = ConditionSet.deserialize(
-                self.choices,
-                value,
-                choice_kwargs=self.widget.choice_kwargs)
+            condition_set = ConditionSet(value.get('mode'), [])
         except InvalidConditionModeError as e:
             raise forms.ValidationError(str(e),
                                         code='invalid_mode')
-        except (ConditionChoiceNotFoundError,
-                ConditionOperatorNotFoundError,
-                InvalidConditionValueError) as e:
-            if getattr(e, 'code', None) == 'required':
-                self.widget.condition_errors[e.condition_index] = \
-                    self.error_messages['value_required']
-            else:
-                self.widget.condition_errors[e.condition_index] = str(e)
+
+        # Deserialize every condition before reporting errors, so that all
+        # invalid conditions can be shown to the user at once.
+        choices = self.choices
+        choice_kwargs = self.widget.choice_kwargs
+        error_messages = self.error_messages
+        conditions = condition_set.conditions
+        condition_errors = {}
+
+        for i, condition_data in enumerate(value.get('conditions', [])):
+            try:
+                conditions.append(Condition.deserialize(
+                    choices,
+                    condition_data,
+                    condition_index=i,
+                    choice_kwargs=choice_kwargs))
+            except (ConditionChoiceNotFoundError,
+                    ConditionOperatorNotFoundError,
+                    InvalidConditionValueError) as e:
+                if getattr(e, 'code', None) == 'required':
+                    condition_errors[e.condition_index] = \
+                        error_messages['value_required']
+                else:
+                    condition_errors[e.condition_index] = str(e)
+
+        if condition_errors:
+            self.widget.condition_errors.update(condition_errors)
 
             raise forms.ValidationError(
-                self.error_messages['condition_errors'],
+                error_messages['condition_errors'],
                 code='condition_errors')
 
         return condition_set
 
+    def _build_choice_field_choices(self, choices):
+        """Return the list of choices for the condition choice field.
+
+        This is computed once when the condition choices are set, rather than
+        when rendering each row.
+
+        Args:
+            choices (djblets.conditions.choices.ConditionChoices):
+                The condition choices for the field.
+
+        Returns:
+            list of tuple:
+            A list of ``(choice_id, name)`` pairs for the choice field.
+        """
+        return [
+            (choice.choice_id, choice.name)
+            for choice in choices
+        ]
+
 
 class ListEditField(forms.Field):
     """A form field for customizing a string representing a list of values.
@@ -279,16 +407,17 @@ class ListEditField(forms.Field):
             ValueError:
                 The value provided is not valid for the widget.
         """
-        if data is None:
-            data = ''
-        elif isinstance(data, list):
+        if isinstance(data, list):
+            # This is the common case when re-rendering a bound form.
             return data
+        elif data is None:
+            data = ''
         elif not isinstance(data, str):
             raise ValueError(
                 gettext('%r is not a valid value for a %s')
                 % (data, self.__class__.__name__))
 
-        return list(item.strip() for item in data.split(self._sep))
+        return list(map(str.strip, data.split(self._sep)))
 
     def to_python(self, value):
         """Return a string of values from the field's data.
@@ -307,7 +436,10 @@ class ListEditField(forms.Field):
         if not value:
             return ''
 
-        return self._sep.join(v.strip() for v in value)
+        return self._sep.join([
+            v.strip()
+            for v in value
+        ])
 
 
 class ListEditDictionaryField(ListEditField):
@@ -348,12 +480,7 @@ class ListEditDictionaryField(ListEditField):
                 gettext('%r is not a valid value for a %s')
                 % (data, self.__class__.__name__))
 
-        return_data = []
-
-        for key, value in data.items():
-            return_data.append((key, value))
-
-        return return_data
+        return list(data.items())
 
     def to_python(self, value):
         """Return a dictionary from the field's data.
@@ -377,14 +504,11 @@ class ListEditDictionaryField(ListEditField):
         if not value:
             return {}
 
-        return_dict = {}
+        return_dict = dict(value)
 
-        for key, val in value:
-            if key in return_dict:
-                raise forms.ValidationError(
-                    self.error_messages['duplicate_key_errors'],
-                    code='duplicate_key_errors')
-
-            return_dict[key] = val
+        if len(return_dict) != len(value):
+            raise forms.ValidationError(
+                self.error_messages['duplicate_key_errors'],
+                code='duplicate_key_errors')
 
         return return_dict
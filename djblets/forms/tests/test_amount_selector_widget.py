@@ -115,6 +115,25 @@ class AmountSelectorWidgetTests(TestCase):
             widget.value_from_datadict(data=data, files={}, name='my_field'),
             None)
 
+    def test_value_from_datadict_with_empty_amount(self) -> None:
+        """Testing AmountSelectorWidget.value_from_datadict with an empty
+        amount
+        """
+        widget = AmountSelectorWidget(unit_choices=[
+            (1, 'bytes'),
+            (1024, 'kilobytes'),
+            (1048576, 'megabytes'),
+            (1073741824, 'gigabytes'),
+        ])
+
+        data = {
+            'my_field_0': '',
+            'my_field_1': '1024',
+        }
+
+        self.assertIsNone(
+            widget.value_from_datadict(data=data, files={}, name='my_field'))
+
     def test_decompress_base(self) -> None:
         """Testing AmountSelectorWidget.decompress with a value in the
         base unit
@@ -165,3 +184,15 @@ class AmountSelectorWidgetTests(TestCase):
         ])
 
         self.assertEqual(widget.decompress(None), (None, None))
+
+    def test_decompress_with_none_unit(self) -> None:
+        """Testing AmountSelectorWidget.decompress with a None unit choice"""
+        widget = AmountSelectorWidget(unit_choices=[
+            (1, 'bytes'),
+            (1024, 'kilobytes'),
+            (1048576, 'megabytes'),
+            (None, 'Unlimited'),
+        ])
+
+        # 3 megabytes.
+        self.assertEqual(widget.decompress(3145728), (3, 1048576))
@@ -1,3 +1,5 @@
+import copy
+
 from django.forms import Form, ValidationError
 
 from djblets.conditions.choices import (BaseConditionChoice,
@@ -6,6 +8,7 @@ from djblets.conditions.choices import (BaseConditionChoice,
                                         ConditionChoices)
 from djblets.conditions.conditions import ConditionSet
 from djblets.forms.fields import ConditionsField
+from djblets.forms.widgets import ConditionsWidget
 from djblets.testing.testcases import TestCase
 
 
@@ -35,6 +38,17 @@ class ConditionsFieldTests(TestCase):
 
         self.assertEqual(field.widget.choice_kwargs, field.choice_kwargs)
 
+    def test_init_with_widget(self):
+        """Testing ConditionsField initialization with custom widget class"""
+        class MyWidget(ConditionsWidget):
+            pass
+
+        choices = ConditionChoices([BaseConditionStringChoice])
+        field = ConditionsField(choices=choices, widget=MyWidget)
+
+        self.assertIsInstance(field.widget, MyWidget)
+        self.assertIs(field.widget.choices, choices)
+
     def test_init_with_missing_operators(self):
         """Testing ConditionsField initialization with choices missing
         operators
@@ -65,6 +79,64 @@ class ConditionsFieldTests(TestCase):
 
         self.assertNotIn('a', form2.fields['conditions'].choice_kwargs)
 
+    def test_deepcopy(self):
+        """Testing ConditionsField.__deepcopy__"""
+        field1 = ConditionsField(
+            choices=ConditionChoices([BaseConditionStringChoice]))
+        field2 = copy.deepcopy(field1)
+
+        # The sub-fields are only used to construct the widgets, so they're
+        # shared between copies rather than copied.
+        self.assertIs(field1.mode_field, field2.mode_field)
+        self.assertIs(field1.choice_field, field2.choice_field)
+        self.assertIs(field1.operator_field, field2.operator_field)
+
+        # The widgets are copied, so that state can be modified per-form.
+        self.assertIsNot(field1.widget, field2.widget)
+        self.assertIsNot(field1.widget.mode_widget,
+                         field2.widget.mode_widget)
+        self.assertIsNot(field1.widget.choice_widget,
+                         field2.widget.choice_widget)
+        self.assertIsNot(field1.widget.operator_widget,
+                         field2.widget.operator_widget)
+        self.assertIs(field1.choices, field2.choices)
+
+    def test_set_choices(self):
+        """Testing ConditionsField.choices setter"""
+        class MyChoice1(BaseConditionStringChoice):
+            choice_id = 'my-choice-1'
+            name = 'My Choice 1'
+
+        class MyChoice2(BaseConditionStringChoice):
+            choice_id = 'my-choice-2'
+            name = 'My Choice 2'
+
+        field = ConditionsField(choices=ConditionChoices([MyChoice1]))
+
+        self.assertEqual(field.widget.choice_widget.choices,
+                         [('my-choice-1', 'My Choice 1')])
+
+        choices = ConditionChoices([MyChoice1, MyChoice2])
+        field.choices = choices
+
+        self.assertIs(field.choices, choices)
+        self.assertIs(field.widget.choices, choices)
+        self.assertEqual(field.widget.choice_widget.choices,
+                         [('my-choice-1', 'My Choice 1'),
+                          ('my-choice-2', 'My Choice 2')])
+
+    def test_set_choices_with_subclass(self):
+        """Testing ConditionsField.choices setter with choices subclass"""
+        class MyChoices(ConditionChoices):
+            choice_classes = [BaseConditionStringChoice]
+
+        field = ConditionsField(choices=ConditionChoices())
+        field.choices = MyChoices
+
+        choices = field.choices
+        self.assertIs(choices.__class__, MyChoices)
+        self.assertIs(field.choices, choices)
+
     def test_prepare_value_with_condition_set(self):
         """Testing ConditionsField.prepare_value with ConditionSet"""
         choices = ConditionChoices([BaseConditionStringChoice])
@@ -257,3 +329,45 @@ class ConditionsFieldTests(TestCase):
             {
                 0: 'A value is required.',
             })
+
+    def test_to_python_with_multiple_errors(self):
+        """Testing ConditionsField.to_python with errors in multiple
+        conditions
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        choices = ConditionChoices([MyChoice])
+        field = ConditionsField(choices=choices)
+
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python({
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'invalid-choice',
+                        'op': 'is',
+                        'value': 'my-value',
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': 123,
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': 'invalid-value',
+                    },
+                ],
+            })
+
+        self.assertEqual(cm.exception.messages,
+                         ['There was an error with one of your conditions.'])
+        self.assertEqual(cm.exception.code, 'condition_errors')
+        self.assertEqual(
+            field.widget.condition_errors,
+            {
+                0: 'No condition choice was found matching "invalid-choice".',
+                2: 'Enter a whole number.',
+            })
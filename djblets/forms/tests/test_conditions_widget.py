@@ -1,5 +1,7 @@
 import copy
 
+import kgb
+from django.forms.widgets import TextInput
 from django.utils.datastructures import MultiValueDict
 
 from djblets.conditions.choices import (BaseConditionChoice,
@@ -13,7 +15,7 @@ from djblets.forms.fields import ConditionsField
 from djblets.testing.testcases import TestCase
 
 
-class ConditionsWidgetTests(TestCase):
+class ConditionsWidgetTests(kgb.SpyAgency, TestCase):
     """Unit tests for djblets.forms.widgets.ConditionsWidget."""
 
     def test_deepcopy(self):
@@ -40,6 +42,54 @@ class ConditionsWidgetTests(TestCase):
         # so both should have the same instance.
         self.assertIs(widget1.choices, widget2.choices)
 
+    def test_media(self):
+        """Testing ConditionsWidget.media is cached"""
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        field = ConditionsField(choices=ConditionChoices([MyChoice]))
+        widget = field.widget
+        media = widget.media
+
+        self.assertIs(widget.media, media)
+
+        # Changing the choice keyword arguments should invalidate the cache.
+        widget.choice_kwargs['abc'] = 123
+
+        self.assertIsNot(widget.media, media)
+
+        # And so should changing the choices.
+        media = widget.media
+        field.choices = ConditionChoices([MyChoice])
+
+        self.assertIsNot(widget.media, media)
+
+    def test_media_with_value_field_widgets(self):
+        """Testing ConditionsWidget.media includes value field widget media"""
+        class MyWidget(TextInput):
+            class Media:
+                js = ('my-widget.js',)
+
+        class MyValueField(ConditionValueCharField):
+            widget = MyWidget()
+
+        shared_value_field = MyValueField()
+
+        class MyOperator(BaseConditionOperator):
+            operator_id = 'my-op'
+            name = 'My Op'
+            value_field = shared_value_field
+
+        class MyChoice(BaseConditionChoice):
+            choice_id = 'my-choice'
+            name = 'My Choice'
+            operators = ConditionOperators([MyOperator])
+            default_value_field = shared_value_field
+
+        field = ConditionsField(choices=ConditionChoices([MyChoice]))
+
+        self.assertEqual(field.widget.media._js, ['my-widget.js'])
+
     def test_value_from_datadict(self):
         """Testing ConditionsWidget.value_from_datadict"""
         class MyChoice(BaseConditionIntegerChoice):
@@ -79,6 +129,94 @@ class ConditionsWidgetTests(TestCase):
                 ],
             })
 
+    def test_value_from_datadict_with_percent_in_name(self):
+        """Testing ConditionsWidget.value_from_datadict with "%" in the field
+        name
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        choices = ConditionChoices([MyChoice])
+        field = ConditionsField(choices=choices)
+
+        data = MultiValueDict('')
+        data.update({
+            'my%conditions_mode': 'any',
+            'my%conditions_last_id': '0',
+            'my%conditions_choice[0]': 'my-choice',
+            'my%conditions_operator[0]': 'is',
+            'my%conditions_value[0]': 'my-value',
+        })
+
+        self.assertEqual(
+            field.widget.value_from_datadict(data, MultiValueDict(''),
+                                             'my%conditions'),
+            {
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': 'my-value',
+                    },
+                ],
+            })
+
+    def test_value_from_datadict_with_shared_choices(self):
+        """Testing ConditionsWidget.value_from_datadict loads each choice and
+        operator only once
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        choices = ConditionChoices([MyChoice])
+        field = ConditionsField(choices=choices)
+
+        self.spy_on(choices.get_choice)
+        self.spy_on(MyChoice.get_operator)
+
+        data = MultiValueDict('')
+        data.update({
+            'my_conditions_mode': 'any',
+            'my_conditions_last_id': '2',
+            'my_conditions_choice[0]': 'my-choice',
+            'my_conditions_operator[0]': 'is',
+            'my_conditions_value[0]': '1',
+            'my_conditions_choice[1]': 'my-choice',
+            'my_conditions_operator[1]': 'is',
+            'my_conditions_value[1]': '2',
+            'my_conditions_choice[2]': 'my-choice',
+            'my_conditions_operator[2]': 'is-not',
+            'my_conditions_value[2]': '3',
+        })
+
+        self.assertEqual(
+            field.widget.value_from_datadict(data, MultiValueDict(''),
+                                             'my_conditions'),
+            {
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': '1',
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': '2',
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is-not',
+                        'value': '3',
+                    },
+                ],
+            })
+
+        self.assertSpyCallCount(choices.get_choice, 1)
+        self.assertSpyCallCount(MyChoice.get_operator, 2)
+
     def test_value_from_datadict_with_missing_data(self):
         """Testing ConditionsWidget.value_from_datadict with missing data"""
         class MyChoice(BaseConditionIntegerChoice):
@@ -380,6 +518,108 @@ class ConditionsWidgetTests(TestCase):
                 'value': None,
             })
 
+    def test_get_context_caches_serialized_choices(self):
+        """Testing ConditionsWidget.get_context reuses serialized choices
+        between renders
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        field = ConditionsField(choices=ConditionChoices([MyChoice]))
+        widget = field.widget
+        value = {
+            'mode': 'any',
+            'conditions': [],
+        }
+
+        serialized_choices = \
+            widget.get_context('my_conditions', value,
+                               {})['serialized_choices']
+
+        self.assertIs(
+            widget.get_context('my_conditions', value,
+                               {})['serialized_choices'],
+            serialized_choices)
+
+        # Changing the choice keyword arguments should invalidate the cache.
+        widget.choice_kwargs['abc'] = 123
+
+        self.assertIsNot(
+            widget.get_context('my_conditions', value,
+                               {})['serialized_choices'],
+            serialized_choices)
+
+        # Copies of the widget should not share the cache.
+        widget2 = copy.deepcopy(widget)
+
+        self.assertIsNot(
+            widget2.get_context('my_conditions', value,
+                                {})['serialized_choices'],
+            widget.get_context('my_conditions', value,
+                               {})['serialized_choices'])
+
+    def test_get_context_reuses_serialized_choice_instances(self):
+        """Testing ConditionsWidget.get_context reuses choices loaded for
+        serialization when rendering rows
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        choices = ConditionChoices([MyChoice])
+        field = ConditionsField(choices=choices)
+
+        self.spy_on(choices.get_choice)
+
+        field.widget.get_context(
+            'my_conditions',
+            {
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': 1,
+                    },
+                ],
+            },
+            {})
+
+        self.assertSpyNotCalled(choices.get_choice)
+
+    def test_get_context_reuses_serialized_operator_instances(self):
+        """Testing ConditionsWidget.get_context reuses operators loaded for
+        serialization when rendering rows
+        """
+        class MyChoice(BaseConditionIntegerChoice):
+            choice_id = 'my-choice'
+
+        choices = ConditionChoices([MyChoice])
+        field = ConditionsField(choices=choices)
+
+        self.spy_on(MyChoice.get_operator,
+                    owner=MyChoice)
+
+        field.widget.get_context(
+            'my_conditions',
+            {
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is',
+                        'value': 1,
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'is-not',
+                        'value': 2,
+                    },
+                ],
+            },
+            {})
+
+        self.assertSpyNotCalled(MyChoice.get_operator)
+
     def test_get_context_with_invalid_choice(self):
         """Testing ConditionsWidget.get_context with invalid choice"""
         class MyOperator1(BaseConditionOperator):
@@ -464,6 +704,11 @@ class ConditionsWidgetTests(TestCase):
                           'delete the condition in order to make changes.'),
             }])
 
+        # The temporary choices and operators should have been removed.
+        self.assertEqual(field.widget.choice_widget.choices,
+                         [('my-choice-1', 'My Choice 1')])
+        self.assertEqual(field.widget.operator_widget.choices, [])
+
     def test_get_context_with_invalid_operator(self):
         """Testing ConditionsWidget.get_context with invalid operator"""
         class MyOperator1(BaseConditionOperator):
@@ -542,6 +787,68 @@ class ConditionsWidgetTests(TestCase):
                           'delete the condition in order to make changes.'),
             }])
 
+    def test_get_context_with_invalid_row_before_valid_row(self):
+        """Testing ConditionsWidget.get_context with an invalid row followed
+        by a valid row
+        """
+        class MyOperator1(BaseConditionOperator):
+            operator_id = 'my-op-1'
+            name = 'My Op 1'
+            value_field = ConditionValueIntegerField()
+
+        class MyChoice1(BaseConditionChoice):
+            choice_id = 'my-choice'
+            name = 'My Choice'
+            operators = ConditionOperators([MyOperator1])
+
+        choices = ConditionChoices([MyChoice1])
+        field = ConditionsField(choices=choices)
+
+        result = field.widget.get_context(
+            'my_conditions',
+            {
+                'mode': 'any',
+                'conditions': [
+                    {
+                        'choice': 'invalid-choice',
+                        'op': 'my-op-1',
+                        'value': 'my-value-1',
+                    },
+                    {
+                        'choice': 'my-choice',
+                        'op': 'my-op-1',
+                        'value': 'my-value-2',
+                    },
+                ],
+            },
+            {
+                'id': 'my-conditions',
+            })
+
+        rendered_rows = result['rendered_rows']
+        self.assertEqual(len(rendered_rows), 2)
+
+        # The first row should be disabled, but that shouldn't carry over to
+        # the second row.
+        self.assertIn('disabled', rendered_rows[0]['choice'])
+        self.assertIn('disabled', rendered_rows[0]['operator'])
+
+        self.assertHTMLEqual(
+            rendered_rows[1]['choice'],
+            '<select id="my-conditions_choice_1"'
+            ' name="my_conditions_choice[1]">\n'
+            '<option value="my-choice" selected="selected">'
+            'My Choice</option>\n'
+            '</select>')
+
+        self.assertHTMLEqual(
+            rendered_rows[1]['operator'],
+            '<select id="my-conditions_operator_1"'
+            ' name="my_conditions_operator[1]">\n'
+            '<option value="my-op-1" selected="selected">'
+            'My Op 1</option>\n'
+            '</select>')
+
     def test_get_context_with_condition_errors(self):
         """Testing ConditionsWidget.get_context with condition errors"""
         class MyOperator1(BaseConditionOperator):
@@ -1,5 +1,7 @@
 """Unit tests for djblets.forms.fields.ListEditDictionaryField."""
 
+from django.forms import ValidationError
+
 from djblets.forms.fields import ListEditDictionaryField
 from djblets.testing.testcases import TestCase
 
@@ -42,3 +44,25 @@ class ListEditDictionaryFieldTests(TestCase):
             {1: 'foo',
              2: 'bar',
              3: 'baz'})
+
+    def test_to_python_with_duplicate_keys(self):
+        """Testing ListEditDictionaryField.to_python with duplicate keys"""
+        field = ListEditDictionaryField()
+
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python([(1, 'foo'), (2, 'bar'), (1, 'baz')])
+
+        self.assertEqual(cm.exception.messages,
+                         ['All keys must be unique.'])
+        self.assertEqual(cm.exception.code, 'duplicate_key_errors')
+
+    def test_to_python_with_duplicate_keys_same_value(self):
+        """Testing ListEditDictionaryField.to_python with duplicate keys
+        sharing the same value
+        """
+        field = ListEditDictionaryField()
+
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python([(1, 'foo'), (1, 'foo')])
+
+        self.assertEqual(cm.exception.code, 'duplicate_key_errors')
@@ -153,3 +153,22 @@ class ListEditWidgetTests(TestCase):
             ' class="my-value-class'
             ' djblets-c-list-edit-widget__input"'
             ' id="id_my_field_value___EDIT_LIST_ROW_ID__" />')
+
+    def test_get_context_with_changed_value_widget(self):
+        """Testing ListEditWidget.get_context renders empty rows using the
+        current state of the value widget
+        """
+        value_widget = forms.widgets.Select(choices=[('a', 'Apple')])
+        widget = ListEditWidget(value_widget=value_widget)
+
+        result = widget.get_context('my_field', [], {})
+        self.assertIn('Apple', result['rendered_empty_row'])
+        self.assertIn('Apple', result['rendered_initial_row'])
+
+        value_widget.choices = [('b', 'Banana')]
+
+        result = widget.get_context('my_field', [], {})
+        self.assertIn('Banana', result['rendered_empty_row'])
+        self.assertNotIn('Apple', result['rendered_empty_row'])
+        self.assertIn('Banana', result['rendered_initial_row'])
+        self.assertNotIn('Apple', result['rendered_initial_row'])
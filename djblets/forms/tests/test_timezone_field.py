@@ -0,0 +1,33 @@
+"""Unit tests for djblets.forms.fields.TimeZoneField."""
+
+import pytz
+
+from djblets.forms.fields import TIMEZONE_CHOICES, TimeZoneField
+from djblets.testing.testcases import TestCase
+
+
+class TimeZoneFieldTests(TestCase):
+    """Unit tests for djblets.forms.fields.TimeZoneField."""
+
+    def test_init(self):
+        """Testing TimeZoneField initialization"""
+        field = TimeZoneField()
+
+        self.assertEqual(
+            field.choices,
+            [
+                (timezone, timezone)
+                for timezone in pytz.common_timezones
+            ])
+
+    def test_init_with_choices(self):
+        """Testing TimeZoneField initialization with custom choices"""
+        field = TimeZoneField(choices=[('UTC', 'UTC')])
+
+        self.assertEqual(field.choices, [('UTC', 'UTC')])
+
+    def test_timezone_choices(self):
+        """Testing TIMEZONE_CHOICES"""
+        self.assertEqual(list(TIMEZONE_CHOICES),
+                         list(zip(pytz.common_timezones,
+                                  pytz.common_timezones)))
@@ -7,7 +7,6 @@ This module contains widgets that correspond to fields provided in
 from __future__ import annotations
 
 import copy
-from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Tuple
 
 from django.forms import widgets
@@ -21,6 +20,12 @@ from djblets.conditions.errors import (ConditionChoiceNotFoundError,
                                        ConditionOperatorNotFoundError)
 
 
+#: A shared hidden input widget used to retain state for disabled fields.
+#:
+#: Rendering doesn't modify the widget, so a single instance can be shared.
+_hidden_input = HiddenInput()
+
+
 class AmountSelectorWidget(widgets.MultiWidget):
     """A widget for editing an amount and its unit of measurement.
 
@@ -79,6 +84,14 @@ class AmountSelectorWidget(widgets.MultiWidget):
         )
         super().__init__(self.widgets, attrs)
 
+        # Store the conversion factors from largest to smallest, so that
+        # decompress() can find the most appropriate unit.
+        self._unit_multipliers: Tuple[int, ...] = tuple(
+            unit_multiplier
+            for unit_multiplier, unit_name in reversed(unit_choices)
+            if unit_multiplier is not None
+        )
+
     def decompress(
         self,
         value: Optional[int],
@@ -108,18 +121,10 @@ class AmountSelectorWidget(widgets.MultiWidget):
         if value is None:
             return None, None
 
-        widget_choices = self.widgets[1].choices
         unit_multiplier = 1
 
-        for choice in reversed(widget_choices):
-            unit_multiplier = choice[0]
-
-            if unit_multiplier is None:
-                continue
-
-            assert isinstance(unit_multiplier, int)
-
-            if (value % unit_multiplier == 0):
+        for unit_multiplier in self._unit_multipliers:
+            if value % unit_multiplier == 0:
                 break
 
         return value // unit_multiplier, unit_multiplier
@@ -150,9 +155,12 @@ class AmountSelectorWidget(widgets.MultiWidget):
             int or None:
             The value to save in the field.
         """
-        value, unit_multiplier = super().value_from_datadict(data, files, name)
+        # Both subwidgets read their values directly from the data, so look
+        # them up here instead of going through MultiWidget.
+        value = data.get('%s_0' % name)
+        unit_multiplier = data.get('%s_1' % name)
 
-        if unit_multiplier in ('', None):
+        if unit_multiplier in ('', None) or value in ('', None):
             return None
         else:
             return int(value) * int(unit_multiplier)
@@ -234,6 +242,8 @@ class ConditionsWidget(widgets.Widget):
         self.operator_widget = operator_widget
         self.choice_kwargs = choice_kwargs
         self.condition_errors = {}
+        self._media_cache = None
+        self._serialized_choices_cache = None
 
     @property
     def media(self):
@@ -243,29 +253,58 @@ class ConditionsWidget(widgets.Widget):
         page will need in order to render this widget and any widgets used
         in the condition value fields.
 
+        The media is computed once and reused until :py:attr:`choices` or
+        :py:attr:`choice_kwargs` change.
+
+        Version Changed:
+            6.0:
+            The result is now cached.
+
         Type:
             django.forms.widgets.Media
         """
+        choices = self.choices
+        choice_kwargs = self.choice_kwargs
+        media_cache = self._media_cache
+
+        if (media_cache is not None and
+            media_cache[0] is choices and
+            media_cache[1] == choice_kwargs):
+            return media_cache[2]
+
         media = (widgets.Media() +
                  self.choice_widget.media +
                  self.operator_widget.media)
 
-        choices = self.choices.get_choices(choice_kwargs=self.choice_kwargs)
-
-        for choice in choices:
-            default_value_field = choice.default_value_field
+        value_fields = []
 
-            if callable(default_value_field):
-                default_value_field = default_value_field()
-
-            if hasattr(default_value_field, 'widget'):
-                media += default_value_field.widget.media
+        for choice in choices.get_choices(choice_kwargs=choice_kwargs):
+            value_fields.append(
+                self._normalize_value_field(choice.default_value_field))
 
             for operator in choice.get_operators():
                 if operator.has_custom_value_field:
-                    if (operator.value_field and
-                        hasattr(operator.value_field, 'widget')):
-                        media += operator.value_field.widget.media
+                    value_fields.append(operator.value_field)
+
+        # Value fields and their widgets are commonly shared between choices
+        # and operators, so only include the media once per widget.
+        seen_widget_ids = set()
+
+        for value_field in value_fields:
+            try:
+                widget = value_field.widget
+            except AttributeError:
+                continue
+
+            widget_id = id(widget)
+
+            if widget_id not in seen_widget_ids:
+                seen_widget_ids.add(widget_id)
+                media += widget.media
+
+        # The choice keyword arguments may be modified in place by the form,
+        # so a copy is stored to compare against.
+        self._media_cache = (choices, copy.copy(choice_kwargs), media)
 
         return media
 
@@ -296,22 +335,25 @@ class ConditionsWidget(widgets.Widget):
 
         conditions = []
 
+        # Conditions commonly share choices and operators, so these are only
+        # loaded once per ID.
+        choice_cache = {}
+        operator_cache = {}
+
         for i in range(last_id):
-            choice_id = data.get('%s_choice[%s]' % (name, i))
+            choice_id = data.get(f'{name}_choice[{i}]')
 
             if choice_id is None:
                 # There's no choice with this ID. It was probably deleted.
                 continue
 
-            operator_id = data.get('%s_operator[%s]' % (name, i))
-            value_name = '%s_value[%s]' % (name, i)
+            operator_id = data.get(f'{name}_operator[{i}]')
+            value_name = f'{name}_value[{i}]'
 
             try:
-                choice = self.choices.get_choice(
-                    choice_id,
-                    choice_kwargs=self.choice_kwargs)
-                operator = choice.get_operator(operator_id)
-                value_field = self._get_value_field(operator)
+                choice = self._get_cached_choice(choice_id, choice_cache)
+                operator, value_field = self._get_cached_operator(
+                    choice, operator_id, operator_cache)
 
                 if value_field is None:
                     value = None
@@ -382,8 +424,6 @@ class ConditionsWidget(widgets.Widget):
         """
         widget_attrs = self.build_attrs(attrs)
         widget_id = widget_attrs.get('id')
-        rendered_rows = []
-        rows = []
 
         # Render the mode radio buttons.
         mode_attrs = widget_attrs
@@ -396,7 +436,101 @@ class ConditionsWidget(widgets.Widget):
             value=value.get('mode', ConditionSet.MODE_ALL),
             attrs=mode_attrs)
 
-        for i, condition in enumerate(value['conditions']):
+        # Any choices and operators loaded while serializing will be reused
+        # for the rows.
+        choice_cache = {}
+        operator_cache = {}
+        serialized_choices = self._get_serialized_choices(choice_cache,
+                                                          operator_cache)
+        conditions = value['conditions']
+
+        if conditions:
+            rendered_rows, rows = self._render_rows(name, conditions,
+                                                    widget_attrs,
+                                                    choice_cache,
+                                                    operator_cache)
+        else:
+            # New forms commonly have no conditions, so there are no rows
+            # to render.
+            rendered_rows = []
+            rows = []
+
+        return {
+            'field_id': widget_id,
+            'field_name': name,
+            'rendered_mode': rendered_mode,
+            'rendered_rows': rendered_rows,
+            'serialized_choices': serialized_choices,
+            'serialized_rows': rows,
+        }
+
+    def _render_rows(self, name, conditions, widget_attrs, choice_cache,
+                     operator_cache):
+        """Render the rows for each condition.
+
+        Args:
+            name (unicode):
+                The base form field name of the widget.
+
+            conditions (list of dict):
+                The serialized conditions to render.
+
+            widget_attrs (dict):
+                The HTML element attributes for the widget.
+
+            choice_cache (dict):
+                A dictionary mapping choice IDs to loaded choices. This will
+                be used for and updated with any choices loaded for the rows.
+
+            operator_cache (dict):
+                A dictionary mapping choice and operator IDs to loaded
+                operators and value fields. This will be used for and updated
+                with any operators loaded for the rows.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (list of dict):
+                    The rendered choice and operator fields and error for
+                    each row.
+
+                1 (list of dict):
+                    The serialized data for each row.
+        """
+        widget_id = widget_attrs.get('id')
+
+        # There's exactly one rendered row and one row of data per condition.
+        rendered_rows = [None] * len(conditions)
+        rows = [None] * len(conditions)
+
+        # Each row may need additional choices or operators added to the
+        # base lists for the subwidgets. These are swapped in for each row
+        # and restored once rendered.
+        choice_widget = self.choice_widget
+        operator_widget = self.operator_widget
+        orig_choices = choice_widget.choices
+        orig_operators = operator_widget.choices
+        base_choices = list(orig_choices)
+        base_operators = list(orig_operators)
+
+        # The attributes for each row's subwidgets. Invalid rows use a
+        # disabled version of the attributes. These are updated in place for
+        # each row, since the subwidgets don't hold onto the attributes
+        # passed in when rendering.
+        enabled_row_attrs = dict(widget_attrs)
+        disabled_row_attrs = dict(widget_attrs, disabled='disabled')
+
+        # These are called for every row, so look them up only once.
+        get_cached_choice = self._get_cached_choice
+        get_cached_operator = self._get_cached_operator
+        get_condition_error = self.condition_errors.get
+        render_choice = choice_widget.render
+        render_operator = operator_widget.render
+        render_hidden = _hidden_input.render
+
+        for i, condition in enumerate(conditions):
             choice_id = condition['choice']
             operator_id = condition['op']
             condition_value = condition.get('value')
@@ -409,11 +543,10 @@ class ConditionsWidget(widgets.Widget):
             # operator is missing. We'll just show the raw data. It won't save,
             # but the user will at least get a suitable error.
             try:
-                choice = self.choices.get_choice(
-                    choice_id,
-                    choice_kwargs=self.choice_kwargs)
-                operator = choice.get_operator(operator_id)
-                error = self.condition_errors.get(i)
+                choice = get_cached_choice(choice_id, choice_cache)
+                operator, value_field = get_cached_operator(
+                    choice, operator_id, operator_cache)
+                error = get_condition_error(i)
             except ConditionChoiceNotFoundError:
                 choice = None
                 operator = None
@@ -426,57 +559,60 @@ class ConditionsWidget(widgets.Widget):
 
             valid = (choice is not None and operator is not None)
 
-            if not valid:
+            if valid:
+                row_attrs = enabled_row_attrs
+            else:
                 # Set the dropdowns to be non-editable.
-                widget_attrs = dict(widget_attrs, disabled='disabled')
+                row_attrs = disabled_row_attrs
 
             if choice is None:
-                choices = ((choice_id, choice_id),)
+                choices = base_choices + [(choice_id, choice_id)]
             else:
-                # Set this to empty so that it'll use the default for the
-                # field.
-                choices = ()
+                # Use the default choices for the field.
+                choices = base_choices
 
             if operator is None:
-                operators = ((operator_id, operator_id),)
+                operators = base_operators + [(operator_id, operator_id)]
             else:
                 # Build the operators specific to this choice.
-                operators = (
+                operators = base_operators + [
                     (operator.operator_id, operator.name)
                     for operator in choice.operators
-                )
+                ]
 
             # Render the list of condition choices.
             choice_name = '%s_choice[%s]' % (name, i)
-            choice_attrs = widget_attrs
 
             if widget_id:
-                choice_attrs = dict(choice_attrs,
-                                    id='%s_choice_%s' % (widget_id, i))
+                row_attrs['id'] = '%s_choice_%s' % (widget_id, i)
+
+            choice_widget.choices = choices
 
-            with self._add_widget_choices(self.choice_widget, choices):
-                rendered_choice = self.choice_widget.render(
+            try:
+                rendered_choice = render_choice(
                     name=choice_name,
                     value=choice_id,
-                    attrs=choice_attrs)
+                    attrs=row_attrs)
+            finally:
+                choice_widget.choices = orig_choices
 
             # Render the list of operators.
             operator_name = '%s_operator[%s]' % (name, i)
-            operator_attrs = widget_attrs
 
             if widget_id:
-                operator_attrs = dict(operator_attrs,
-                                      id='%s_operator_%s' % (widget_id, i))
+                row_attrs['id'] = '%s_operator_%s' % (widget_id, i)
 
-            with self._add_widget_choices(self.operator_widget, operators):
-                rendered_operator = self.operator_widget.render(
+            operator_widget.choices = operators
+
+            try:
+                rendered_operator = render_operator(
                     name=operator_name,
                     value=operator_id,
-                    attrs=operator_attrs)
+                    attrs=row_attrs)
+            finally:
+                operator_widget.choices = orig_operators
 
             if valid:
-                value_field = self._get_value_field(operator)
-
                 if value_field is not None:
                     condition_value = \
                         value_field.prepare_value_for_widget(condition_value)
@@ -486,25 +622,17 @@ class ConditionsWidget(widgets.Widget):
                 # disable the form fields without losing that state when
                 # submitting the form (since browsers don't send along data
                 # from disabled form fields).
-                hidden = widgets.HiddenInput()
-                rendered_choice += hidden.render(name=choice_name,
+                rendered_choice += render_hidden(name=choice_name,
                                                  value=choice_id)
-                rendered_operator += hidden.render(name=operator_name,
+                rendered_operator += render_hidden(name=operator_name,
                                                    value=operator_id)
 
-            # Render the value widget.
-            value_attrs = widget_attrs
-
-            if widget_id:
-                value_attrs = dict(value_attrs,
-                                   id='%s_value_%s' % (widget_id, i))
-
             # Store the information for the template.
-            rendered_rows.append({
+            rendered_rows[i] = {
                 'choice': rendered_choice,
                 'operator': rendered_operator,
                 'error': error,
-            })
+            }
 
             row_data = {
                 'choiceID': choice_id,
@@ -516,22 +644,58 @@ class ConditionsWidget(widgets.Widget):
             if error:
                 row_data['error'] = error
 
-            rows.append(row_data)
+            rows[i] = row_data
 
-        return {
-            'field_id': widget_id,
-            'field_name': name,
-            'rendered_mode': rendered_mode,
-            'rendered_rows': rendered_rows,
-            'serialized_choices': [
-                self._serialize_choice(temp_choice)
-                for temp_choice in self.choices.get_choices(
-                    choice_kwargs=self.choice_kwargs)
-            ],
-            'serialized_rows': rows,
-        }
+        return rendered_rows, rows
+
+    def _get_serialized_choices(self, choice_cache, operator_cache):
+        """Return the serialized choices for the widget.
+
+        The serialized choices only depend on :py:attr:`choices` and
+        :py:attr:`choice_kwargs`, so they're computed once and reused for
+        further renders of this widget until either of those change.
+
+        Copies of the widget made for new forms will compute their own
+        serialized choices, since value fields may depend on state (such as
+        database queries) that can change between forms.
+
+        Args:
+            choice_cache (dict):
+                A dictionary mapping choice IDs to loaded choices. If the
+                choices need to be serialized, this will be updated with the
+                loaded choices, so that they can be reused by the caller.
+
+            operator_cache (dict):
+                A dictionary mapping choice and operator IDs to loaded
+                operators and value fields. If the choices need to be
+                serialized, this will be updated with the loaded operators.
+
+        Returns:
+            list of dict:
+            The list of serialized choices.
+        """
+        choices = self.choices
+        choice_kwargs = self.choice_kwargs
+        cache = self._serialized_choices_cache
+
+        if (cache is not None and
+            cache[0] is choices and
+            cache[1] == choice_kwargs):
+            return cache[2]
+
+        serialized_choices = []
+
+        for choice in choices.get_choices(choice_kwargs=choice_kwargs):
+            choice_cache[choice.choice_id] = choice
+            serialized_choices.append(
+                self._serialize_choice(choice, operator_cache))
+
+        self._serialized_choices_cache = (choices, copy.copy(choice_kwargs),
+                                          serialized_choices)
 
-    def _serialize_choice(self, choice):
+        return serialized_choices
+
+    def _serialize_choice(self, choice, operator_cache):
         """Return a serialized choice for the widget.
 
         This contains information needed by the JavaScript UI to render the
@@ -543,22 +707,34 @@ class ConditionsWidget(widgets.Widget):
             choice (djblets.conditions.choices.BaseConditionChoice):
                 The choice to serialize.
 
+            operator_cache (dict):
+                A dictionary mapping choice and operator IDs to loaded
+                operators and value fields. This will be updated with the
+                choice's operators.
+
         Returns:
             dict:
             The serialized choice.
         """
+        choice_id = choice.choice_id
+        serialized_operators = []
+
+        for operator in choice.get_operators():
+            value_field = self._get_value_field(operator)
+            operator_cache[(choice_id, operator.operator_id)] = \
+                (operator, value_field)
+            serialized_operators.append(
+                self._serialize_operator(operator, value_field))
+
         return {
-            'id': choice.choice_id,
+            'id': choice_id,
             'name': choice.name,
             'valueField': self._serialize_value_field(
                 self._normalize_value_field(choice.default_value_field)),
-            'operators': [
-                self._serialize_operator(operator)
-                for operator in choice.get_operators()
-            ]
+            'operators': serialized_operators,
         }
 
-    def _serialize_operator(self, operator):
+    def _serialize_operator(self, operator, value_field):
         """Return a serialized operator for the widget.
 
         This contains information needed by the JavaScript UI to render the
@@ -570,6 +746,9 @@ class ConditionsWidget(widgets.Widget):
             operator (djblets.conditions.operators.BaseConditionOperator):
                 The operator to serialize.
 
+            value_field (djblets.conditions.values.BaseConditionValueField):
+                The normalized value field for the operator, or ``None``.
+
         Returns:
             dict:
             The serialized operator.
@@ -580,8 +759,6 @@ class ConditionsWidget(widgets.Widget):
             'useValue': True,
         }
 
-        value_field = self._get_value_field(operator)
-
         if value_field is None:
             # This operator doesn't want any kind of value field.
             data['useValue'] = False
@@ -620,6 +797,75 @@ class ConditionsWidget(widgets.Widget):
         else:
             return {}
 
+    def _get_cached_choice(self, choice_id, cache):
+        """Return a choice instance, reusing any previously-loaded instance.
+
+        Args:
+            choice_id (unicode):
+                The ID of the choice to return.
+
+            cache (dict):
+                A dictionary mapping choice IDs to loaded choices. This is
+                used for the duration of a single operation.
+
+        Returns:
+            djblets.conditions.choices.BaseConditionChoice:
+            The choice instance.
+
+        Raises:
+            djblets.conditions.errors.ConditionChoiceNotFoundError:
+                No choice was found that matched the given ID.
+        """
+        try:
+            choice = cache[choice_id]
+        except KeyError:
+            choice = self.choices.get_choice(choice_id,
+                                             choice_kwargs=self.choice_kwargs)
+            cache[choice_id] = choice
+
+        return choice
+
+    def _get_cached_operator(self, choice, operator_id, cache):
+        """Return an operator and its value field, reusing any loaded ones.
+
+        Args:
+            choice (djblets.conditions.choices.BaseConditionChoice):
+                The choice containing the operator.
+
+            operator_id (unicode):
+                The ID of the operator to return.
+
+            cache (dict):
+                A dictionary mapping choice and operator IDs to loaded
+                operators and value fields. This is used for the duration of
+                a single operation.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (djblets.conditions.operators.BaseConditionOperator):
+                    The operator instance.
+
+                1 (djblets.conditions.values.BaseConditionValueField):
+                    The normalized value field for the operator, or ``None``.
+
+        Raises:
+            djblets.conditions.errors.ConditionOperatorNotFoundError:
+                No operator was found that matched the given ID.
+        """
+        key = (choice.choice_id, operator_id)
+
+        try:
+            result = cache[key]
+        except KeyError:
+            operator = choice.get_operator(operator_id)
+            result = (operator, self._get_value_field(operator))
+            cache[key] = result
+
+        return result
+
     def _get_value_field(self, operator):
         """Return the normalized value field for an operator.
 
@@ -658,29 +904,6 @@ class ConditionsWidget(widgets.Widget):
 
         return value_field
 
-    @contextmanager
-    def _add_widget_choices(self, widget, choices):
-        """Temporarily add choices to a widget.
-
-        This temporary appends the provided list of choices to a widget's
-        existing list, allowing some additional choices to be there for
-        rendering purposes. After the caller's logic is done, the list of
-        choices will be reset.
-
-        Args:
-            widget (django.forms.fields.widgets.ChoiceInput):
-                The choice widget.
-
-            choices (list):
-                The list of choices to temporarily append.
-        """
-        old_choices = widget.choices
-        widget.choices = widget.choices + list(choices)
-
-        yield
-
-        widget.choices = old_choices
-
     def __deepcopy__(self, memo):
         """Return a deep copy of the widget.
 
@@ -700,11 +923,19 @@ class ConditionsWidget(widgets.Widget):
             A deep copy of this widget's instance.
         """
         obj = super(ConditionsWidget, self).__deepcopy__(memo)
+
+        # Django's widgets only shallow-copy themselves along with their
+        # attributes and choices when deep-copied, so this is inexpensive.
+        # Going through copy.deepcopy() ensures any custom widget subclasses
+        # can still copy their own state.
         obj.mode_widget = copy.deepcopy(self.mode_widget, memo)
         obj.choice_widget = copy.deepcopy(self.choice_widget, memo)
         obj.operator_widget = copy.deepcopy(self.operator_widget, memo)
-        obj.condition_errors = copy.deepcopy(self.condition_errors, memo)
+        # Condition errors map condition indexes to error message strings,
+        # so a shallow copy is enough.
+        obj.condition_errors = self.condition_errors.copy()
         obj.choice_kwargs = self.choice_kwargs.copy()
+        obj._serialized_choices_cache = None
 
         return obj
 
@@ -861,28 +1092,36 @@ class ListEditWidget(widgets.Widget):
         else:
             attrs['class'] = 'djblets-c-list-edit-widget__input'
 
-        for i, val in enumerate(value):
-            if id_ is not None:
-                row_attrs = dict(attrs, **{
-                    'id': f'{id_}_value_{i}',
-                })
-            else:
-                row_attrs = attrs
+        # These are called for every row, so look them up only once.
+        render_value = value_widget.render
+        add_rendered_row = rendered_rows.append
 
-            rendered_rows.append(value_widget.render(
-                name=f'{name}_value[{i}]',
-                value=val,
-                attrs=row_attrs))
+        if id_ is None:
+            row_attrs = attrs
+
+            for i, val in enumerate(value):
+                add_rendered_row(render_value(
+                    name=f'{name}_value[{i}]',
+                    value=val,
+                    attrs=row_attrs))
+        else:
+            # The ID is updated in place for each row, since the value
+            # widget doesn't hold onto the attributes passed in when
+            # rendering.
+            row_attrs = attrs.copy()
+
+            for i, val in enumerate(value):
+                row_attrs['id'] = f'{id_}_value_{i}'
+                add_rendered_row(render_value(
+                    name=f'{name}_value[{i}]',
+                    value=val,
+                    attrs=row_attrs))
 
         # Render the default row, which will be used when adding a new row.
         if id_ is not None:
-            row_attrs = dict(attrs, **{
-                'id': f'{id_}_value___EDIT_LIST_ROW_ID__',
-            })
-        else:
-            row_attrs = attrs
+            row_attrs['id'] = f'{id_}_value___EDIT_LIST_ROW_ID__'
 
-        rendered_empty_row = value_widget.render(
+        rendered_empty_row = render_value(
             name=f'{name}_value[__EDIT_LIST_ROW_INDEX__]',
             value=None,
             attrs=row_attrs)
@@ -892,13 +1131,9 @@ class ListEditWidget(widgets.Widget):
             rendered_initial_row = ''
         else:
             if id_ is not None:
-                row_attrs = dict(attrs, **{
-                    'id': f'{id_}_value_0',
-                })
-            else:
-                row_attrs = attrs
+                row_attrs['id'] = f'{id_}_value_0'
 
-            rendered_initial_row = value_widget.render(
+            rendered_initial_row = render_value(
                 name=f'{name}_value[0]',
                 value=None,
                 attrs=row_attrs)
@@ -937,17 +1172,14 @@ class ListEditWidget(widgets.Widget):
             values for legacy behavior.
         """
         value_widget = self._value_widget
-        values = []
 
         try:
-            num_rows = int(data['%s_num_rows' % name])
-
-            for i in range(num_rows):
-                values.append(
-                    value_widget.value_from_datadict(
-                        data,
-                        files,
-                        '%s_value[%s]' % (name, i)))
+            num_rows = int(data[f'{name}_num_rows'])
+            values = [
+                value_widget.value_from_datadict(data, files,
+                                                 f'{name}_value[{i}]')
+                for i in range(num_rows)
+            ]
         except (KeyError, ValueError):
             # In this case the widget was called but not rendered, so fetch
             # the data from the field name key in the data dict instead of
@@ -137,7 +137,8 @@ class BaseWebAPIToken(models.Model):
 
         super().save(*args, **kwargs)
 
-        if not is_new:
+        # Only build and send the signal if anything is listening for it.
+        if not is_new and webapi_token_updated.has_listeners(type(self)):
             webapi_token_updated.send(instance=self, sender=type(self))
 
     @classmethod
@@ -162,12 +163,12 @@ class BaseWebAPIToken(models.Model):
             # is empty, we can stop here.
             return
 
-        if 'resources' not in policy:
+        try:
+            resources_section = policy['resources']
+        except KeyError:
             raise ValidationError(
                 _('The policy is missing a "resources" section.'))
 
-        resources_section = policy['resources']
-
         if not isinstance(resources_section, dict):
             raise ValidationError(
                 _('The policy\'s "resources" section must be a JSON object.'))
@@ -180,31 +181,31 @@ class BaseWebAPIToken(models.Model):
             cls._validate_policy_section(resources_section, '*',
                                          'resources.*')
 
-        resource_policies = [
-            (section_name, section)
-            for section_name, section in resources_section.items()
-            if section_name != '*'
-        ]
+        # The valid policy IDs are only needed if there are resource-specific
+        # sections, so they're loaded on first use.
+        valid_policy_ids = None
 
-        if resource_policies:
-            valid_policy_ids = \
-                cls._get_valid_policy_ids(cls.get_root_resource())
+        for policy_id, section in resources_section.items():
+            if policy_id == '*':
+                continue
 
-            for policy_id, section in resource_policies:
-                if policy_id not in valid_policy_ids:
-                    raise ValidationError(
-                        _('"%s" is not a valid resource policy ID.')
-                        % policy_id)
+            if valid_policy_ids is None:
+                valid_policy_ids = cls._get_cached_valid_policy_ids()
+
+            if policy_id not in valid_policy_ids:
+                raise ValidationError(
+                    _('"%s" is not a valid resource policy ID.')
+                    % policy_id)
 
-                for subsection_name, subsection in section.items():
-                    if not isinstance(subsection_name, str):
-                        raise ValidationError(
-                            _('%s must be a string in "resources.%s"')
-                            % (subsection_name, policy_id))
+            for subsection_name, subsection in section.items():
+                if not isinstance(subsection_name, str):
+                    raise ValidationError(
+                        _('%s must be a string in "resources.%s"')
+                        % (subsection_name, policy_id))
 
-                    cls._validate_policy_section(
-                        section, subsection_name,
-                        'resources.%s.%s' % (policy_id, subsection_name))
+                cls._validate_policy_section(
+                    section, subsection_name,
+                    'resources.%s.%s' % (policy_id, subsection_name))
 
     @classmethod
     def _validate_policy_section(cls, parent_section, section_name,
@@ -216,35 +217,78 @@ class BaseWebAPIToken(models.Model):
                 _('The "%s" section must be a JSON object.')
                 % full_section_name)
 
-        if 'allow' not in section and 'block' not in section:
+        has_allow = 'allow' in section
+        has_block = 'block' in section
+
+        if not has_allow and not has_block:
             raise ValidationError(
                 _('The "%s" section must have "allow" and/or "block" '
                   'rules.')
                 % full_section_name)
 
-        if 'allow' in section and not isinstance(section['allow'], list):
+        if has_allow and not isinstance(section['allow'], list):
             raise ValidationError(
                 _('The "%s" section\'s "allow" rule must be a list.')
                 % full_section_name)
 
-        if 'block' in section and not isinstance(section['block'], list):
+        if has_block and not isinstance(section['block'], list):
             raise ValidationError(
                 _('The "%s" section\'s "block" rule must be a list.')
                 % full_section_name)
 
+    @classmethod
+    def clear_policy_id_cache(cls):
+        """Clear the cached list of valid resource policy IDs.
+
+        The valid policy IDs are computed once from the root resource and
+        reused for further policy validation. This should be called if the
+        resource tree changes.
+
+        Version Added:
+            6.0
+        """
+        cls._valid_policy_ids_cache = None
+
+    @classmethod
+    def _get_cached_valid_policy_ids(cls):
+        """Return the valid resource policy IDs for the root resource.
+
+        The policy IDs are cached on the token class, and recomputed if the
+        root resource changes or :py:meth:`clear_policy_id_cache` is called.
+
+        Returns:
+            frozenset of str:
+            The valid resource policy IDs.
+        """
+        root_resource = cls.get_root_resource()
+
+        # Look this up on the class itself, so that subclasses don't share
+        # a cache with their parents.
+        cache = cls.__dict__.get('_valid_policy_ids_cache')
+
+        if cache is not None and cache[0] is root_resource:
+            return cache[1]
+
+        valid_policy_ids = frozenset(cls._get_valid_policy_ids(root_resource))
+        cls._valid_policy_ids_cache = (root_resource, valid_policy_ids)
+
+        return valid_policy_ids
+
     @classmethod
     def _get_valid_policy_ids(cls, resource, result=None):
         if result is None:
             result = set()
 
-        if hasattr(resource, 'policy_id'):
-            result.add(resource.policy_id)
+        resources = [resource]
+
+        while resources:
+            resource = resources.pop()
 
-        for child_resource in resource.list_child_resources:
-            cls._get_valid_policy_ids(child_resource, result)
+            if hasattr(resource, 'policy_id'):
+                result.add(resource.policy_id)
 
-        for child_resource in resource.item_child_resources:
-            cls._get_valid_policy_ids(child_resource, result)
+            resources += resource.list_child_resources
+            resources += resource.item_child_resources
 
         return result
 
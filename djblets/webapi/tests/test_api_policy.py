@@ -1,3 +1,5 @@
+import kgb
+
 from djblets.testing.testcases import TestCase
 from djblets.webapi.resources.base import WebAPIResource
 from djblets.webapi.resources.mixins.api_tokens import ResourceAPITokenMixin
@@ -319,8 +321,13 @@ class APIPolicyTests(TestCase):
                           % method)
 
 
-class APIPolicyValidationTests(TestCase):
+class APIPolicyValidationTests(kgb.SpyAgency, TestCase):
     """Tests API policy validation."""
+    def setUp(self):
+        super(APIPolicyValidationTests, self).setUp()
+
+        APIPolicyWebAPIToken.clear_policy_id_cache()
+
     def test_empty(self):
         """Testing BaseWebAPIToken.validate_policy with empty policy"""
         APIPolicyWebAPIToken.validate_policy({})
@@ -632,3 +639,93 @@ class APIPolicyValidationTests(TestCase):
                     }
                 }
             })
+
+    #
+    # Valid policy IDs
+    #
+
+    def test_get_valid_policy_ids_with_nested_resources(self):
+        """Testing BaseWebAPIToken._get_valid_policy_ids with nested list and
+        item child resources
+        """
+        class ListChildResource(ResourceAPITokenMixin, WebAPIResource):
+            policy_id = 'list-child'
+
+        class ItemChildResource(ResourceAPITokenMixin, WebAPIResource):
+            policy_id = 'item-child'
+
+        class ParentResource(ResourceAPITokenMixin, WebAPIResource):
+            policy_id = 'parent'
+            list_child_resources = [ListChildResource()]
+            item_child_resources = [ItemChildResource()]
+
+        self.assertEqual(
+            APIPolicyWebAPIToken._get_valid_policy_ids(
+                RootResource([ParentResource(), SomeObjectResource()])),
+            {'list-child', 'item-child', 'parent', 'someobject'})
+
+    #
+    # Policy ID caching
+    #
+
+    def test_resource_policy_ids_cached(self):
+        """Testing BaseWebAPIToken.validate_policy caches valid resource
+        policy IDs
+        """
+        self.spy_on(APIPolicyWebAPIToken._get_valid_policy_ids)
+
+        policy = {
+            'resources': {
+                'someobject': {
+                    '42': {
+                        'allow': ['*'],
+                    },
+                }
+            }
+        }
+
+        APIPolicyWebAPIToken.validate_policy(policy)
+        num_calls = len(APIPolicyWebAPIToken._get_valid_policy_ids.calls)
+        self.assertGreater(num_calls, 0)
+
+        APIPolicyWebAPIToken.validate_policy(policy)
+        self.assertSpyCallCount(APIPolicyWebAPIToken._get_valid_policy_ids,
+                                num_calls)
+
+    def test_clear_policy_id_cache(self):
+        """Testing BaseWebAPIToken.clear_policy_id_cache"""
+        self.spy_on(APIPolicyWebAPIToken._get_valid_policy_ids)
+
+        policy = {
+            'resources': {
+                'someobject': {
+                    '42': {
+                        'allow': ['*'],
+                    },
+                }
+            }
+        }
+
+        APIPolicyWebAPIToken.validate_policy(policy)
+        num_calls = len(APIPolicyWebAPIToken._get_valid_policy_ids.calls)
+
+        APIPolicyWebAPIToken.clear_policy_id_cache()
+        APIPolicyWebAPIToken.validate_policy(policy)
+        self.assertSpyCallCount(APIPolicyWebAPIToken._get_valid_policy_ids,
+                                num_calls * 2)
+
+    def test_global_only_skips_policy_ids(self):
+        """Testing BaseWebAPIToken.validate_policy with only a '*' section
+        doesn't load valid resource policy IDs
+        """
+        self.spy_on(APIPolicyWebAPIToken.get_root_resource)
+
+        APIPolicyWebAPIToken.validate_policy({
+            'resources': {
+                '*': {
+                    'allow': ['*'],
+                },
+            }
+        })
+
+        self.assertSpyNotCalled(APIPolicyWebAPIToken.get_root_resource)
@@ -0,0 +1,4 @@
+import './listItemViewTests';
+import './listViewTests';
+import './tableItemViewTests';
+import './tableViewTests';
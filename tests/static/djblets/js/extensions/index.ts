@@ -0,0 +1,3 @@
+export * from './models/extensionModel';
+export * from './models/extensionHookModel';
+export * from './models/extensionHookPointModel';
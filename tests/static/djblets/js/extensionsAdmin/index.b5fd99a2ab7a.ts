@@ -0,0 +1,2 @@
+export * from './models/extensionManagerModel';
+export * from './views/extensionManagerView';
@@ -0,0 +1,2 @@
+/* Define a namespace for Djblets.Forms. */
+export const Forms = {};
@@ -0,0 +1,61 @@
+/*
+ * Copyright 2008-2010 Christian Hammond.
+ * Copyright 2010-2013 Beanbag, Inc.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+(function($) {
+
+
+$.tooltip = function($el, options) {
+    options = $.extend({
+        side: 'b'
+    }, options);
+
+    var self = $('<div>')
+        .addClass('tooltip')
+        .hide()
+        .appendTo('body');
+
+    /*
+     * We use mouseenter and mouseleave instead of hover() because we don't
+     * want to show tooltips as a result of touch events.
+     */
+    $el
+        .mouseenter(function() {
+            if (self.children()) {
+                self
+                    .positionToSide($el, {
+                        distance: 10,
+                        side: options.side
+                    })
+                    .show();
+            }
+        })
+        .mouseleave(function() {
+            self.hide();
+        });
+
+    return self;
+};
+
+
+})(jQuery);
+
+// vim: set et:
@@ -0,0 +1,2 @@
+import '../configForms/models/tests';
+import '../configForms/views/tests';